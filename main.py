@@ -4,6 +4,8 @@
 # Orchestrates user interaction and round progression.
 
 
+import sys
+
 from yahtzee import (
     create_empty_scorecard,
     display_scorecard,
@@ -53,11 +55,14 @@ def main():
     final_total = up + b + low
     
     # Closing summary with clearly labeled components, then the grand total.
-    print("\nGame over!")
-    print(f"Upper subtotal : {up}")
-    print(f"Bonus          : {b}")
-    print(f"Lower subtotal : {low}")
-    print(f"Final score    : {final_total}")
+    # Built as one string and emitted with a single write.
+    sys.stdout.write(
+        "\nGame over!\n"
+        f"Upper subtotal : {up}\n"
+        f"Bonus          : {b}\n"
+        f"Lower subtotal : {low}\n"
+        f"Final score    : {final_total}\n"
+    )
     
 if __name__ == "__main__":
     main()
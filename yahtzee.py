@@ -8,6 +8,7 @@
 # - We employ *built-in data structures* (lists, dicts) and standard control-flow (ifs/loops).  [2][3]
 # - We demonstrate *dictionary comprehension* to construct an empty scorecard mapping all categories to a sentinel `None`.  [2]
 # - We rely on the *Python Standard Library* only (no third-party libs): `random` for dice, `collections.Counter` for counting multiplicities. [3]
+#   (Exception: `numba`/`numpy` are *optional*, imported only on first use of the simulation fast paths `roll_dice_np`/`evaluate_fast`; the game itself never imports them.)
 
 # [1] Functions & docstrings.
 # [2] Data types (lists/dicts), comprehensions, slices, typecast.
@@ -15,19 +16,41 @@
 
 
 from collections import Counter     # Standard counting Abstract Data Type for multiplicities [3]
+from functools import lru_cache     # Memoization decorator for the pure scoring function evaluate() [3]
 import random                       # Pseudo-Random Number Generator for dice rolls (uniform 1..6) [3]
+import sys                          # Direct access to stdout for buffered, single-write rendering [3]
 
 
 # Global variable (module level) lower bound locked used by select_keep()
 
 _KEEP_LOCK = None
 
+# Die faces and a module-level alias of random.choices used by roll_dice(): one C-level call draws the whole hand.
+
+_FACES = (1, 2, 3, 4, 5, 6)
+_choices = random.choices
+
+# NumPy generator for roll_dice_np(): draws whole batches of dice in C. Created on the first call,
+# so `import yahtzee` never loads numpy.
+
+_rng = None
+
+# Valid keep-digits precomputed once at import: frozenset membership is an O(1) hash probe, and the
+# char -> int table avoids an int() conversion call per character in _parse_keep_string().
+
+_VALID_FACES = frozenset("123456")
+_FACE_INT = {'1': 1, '2': 2, '3': 3, '4': 4, '5': 5, '6': 6}
+
+# Accepted answers to the "Stop here?" prompt in play_round(), built once instead of per loop iteration.
+
+_YN = frozenset(("y", "n"))
+
 # Canonical Category Definitions
 
-# Note: we separate *upper* and *lower* sections as two lists so we can compute subtotals and bonus cleanly using membership.
+# Note: we separate *upper* and *lower* sections as two tuples (immutable sequences) so we can compute subtotals and bonus cleanly using membership.
 
-UPPER_CATEGORIES = ['1', '2', '3', '4', '5', '6']
-LOWER_CATEGORIES = [
+UPPER_CATEGORIES = ('1', '2', '3', '4', '5', '6')
+LOWER_CATEGORIES = (
     'three_of_a_kind',
     'four_of_a_kind',
     'full_house',
@@ -35,10 +58,45 @@ LOWER_CATEGORIES = [
     'five_straight',
     'yahtzee',
     'chance',
-]
-# Concatenate via list addition to preserve order
+)
+# Concatenate via tuple addition to preserve order
 ALL_CATEGORIES = UPPER_CATEGORIES + LOWER_CATEGORIES
 
+# Dictionary with readable labels for lower categories, built once at import (used by display_scorecard()).
+# We keep a mapping separate from internal keys to decouple display text (localizable) from logic keys.
+_LOWER_LABELS = {
+    'three_of_a_kind': 'Three of a Kind',
+    'four_of_a_kind':  'Four of a Kind',
+    'full_house':      'Full House (25)',
+    'four_straight':   'Four Straight (30)',
+    'five_straight':   'Five Straight (40)',
+    'yahtzee':         'Yahtzee (50)',
+    'chance':          'Chance',
+}
+
+# Pre-formatted upper-section row prefixes; format specifier `:>1` right-aligns the single-character key within width 1.
+_UPPER_FMT = [f"  {k:>1}: " for k in UPPER_CATEGORIES]
+
+# Sentinel for card.get() in the subtotal helpers: distinguishes "key absent" from a stored `None` (unused).
+_MISSING = object()
+
+
+def _prompt(msg):
+    """
+    Lightweight replacement for `input()`: write `msg` to stdout (only if non-empty) and read one line from stdin.
+
+    Returns the line without its trailing newline; raises `EOFError` at end of input, like `input()`.
+    `sys.stdin`/`sys.stdout` are looked up per call so redirected streams are honoured.
+    """
+    if msg:
+        out = sys.stdout
+        out.write(msg)
+        out.flush()  # the prompt has no newline, so flush before blocking on stdin
+    line = sys.stdin.readline()
+    if not line:
+        raise EOFError
+    return line[:-1] if line.endswith("\n") else line
+
 
 def set_keep_lock(lock):
     """
@@ -61,11 +119,38 @@ def roll_dice(n = 5):
         A Python list with `n` integer outcomes in [1, 6].
 
     Notes:
-    - Uses `random.randint(1, 6)` from the standard library (no third-party).
+    - Uses `random.choices` from the standard library (no third-party), drawing all `n` faces in one call.
     - The list is a suitable *sequence* for further transformations (slicing, sorting, counting)
     """
-    # Control-flow: list comprehension to compactly generate `n` samples. This is both idiomatic and efficient.
-    return [random.randint(1, 6) for _ in range(n)]
+    # Single call instead of `n` calls to random.randint(1, 6): the sampling loop runs in C and returns a fresh, mutable list.
+    return _choices(_FACES, k=n)
+
+
+def roll_dice_np(n = 5):
+    """
+    Roll `n` unbiased six-faced dice into a NumPy array (simulation fast path).
+
+    Returns:
+    numpy.ndarray[int8]
+        `n` outcomes in [1, 6], directly consumable by `evaluate_fast` without conversion.
+
+    Raises:
+    ImportError
+        If numpy is not installed (interactive play uses `roll_dice`, which needs only the standard library).
+
+    Notes:
+    - numpy is imported and the generator created on the first call only.
+    - Two regimes: `roll_dice` (stdlib `random.choices`) has the lower fixed cost for one interactive hand;
+      `roll_dice_np` wins when a simulation draws many dice per call (the sampling loop runs in C).
+    """
+    global _rng
+    if _rng is None:
+        try:
+            import numpy as np
+        except ImportError as exc:
+            raise ImportError("roll_dice_np() requires numpy; use roll_dice() for the standard-library path") from exc
+        _rng = np.random.default_rng()
+    return _rng.integers(1, 7, size=n, dtype="int8")
 
 
 def create_empty_scorecard():
@@ -110,8 +195,8 @@ def _parse_keep_string(s):
     for ch in s:    # Iterate over each character in the cleaned string.
 
         # Defensive input handling: only accept characters '1'..'6'.
-        if ch in '123456':
-            digits.append(int(ch)) # If ch is in '123456', we convert to int and append to the result
+        if ch in _VALID_FACES:
+            digits.append(_FACE_INT[ch]) # If ch is a valid face, we map it to its int via the lookup table and append to the result
         else:
             return None            # As soon as we encounter an invalid symbol (e.g., '0', '7', 'x'), we abort and signal invalid input by returning None.
 
@@ -134,12 +219,12 @@ def select_keep(dice):
 
     Returns:
     list[int]
-        A valid kept multiset rendered as a list of ints.
+        A valid kept multiset rendered as a sorted list of ints (e.g., '63' -> [3, 6]).
 
     Notes:
     - Input parsing is delegated to `_parse_keep_string` (separation of concerns).
-    - Feasibility is a *sub-multiset* test with Counters:
-         ∀v in want: want[v] ≤ pool[v].
+    - Feasibility is a *sub-multiset* test on 7-slot tally lists indexed by face (no Counter allocation):
+         ∀v in 1..6: want[v] ≤ pool[v].
     - Lock constraint is a *lower-bound* test:
          ∀v in _KEEP_LOCK: want[v] ≥ _KEEP_LOCK[v].
     """
@@ -148,14 +233,18 @@ def select_keep(dice):
         if _KEEP_LOCK and sum(_KEEP_LOCK.values()):
             print(f"Locked ≥ : {sorted(_KEEP_LOCK.elements())}") # Show the locked dice in sorted order for clarity.
             
-        raw = input("Type dice to KEEP (e.g., 336), or press Enter to keep none: ")
+        raw = _prompt("Type dice to KEEP (e.g., 336), or press Enter to keep none: ")
         kept_list = _parse_keep_string(raw)
         if kept_list is None:
             print("Invalid input: use only digits 1–6. Try again.")
             continue
 
-        pool = Counter(dice)           # multiplicities available in current hand
-        want = Counter(kept_list)      # multiplicities requested by the player
+        pool = [0] * 7                 # multiplicities available in current hand (slot 0 unused)
+        for d in dice:
+            pool[d] += 1
+        want = [0] * 7                 # multiplicities requested by the player
+        for d in kept_list:
+            want[d] += 1
 
         # Enforce non-decreasing lock (no un-keep): want[v] ≥ _KEEP_LOCK[v]
         if _KEEP_LOCK is not None:
@@ -166,12 +255,11 @@ def select_keep(dice):
                 continue
 
         # Feasibility: want is a sub-multiset of pool → want[v] ≤ pool[v]
-        if all(want[v] <= pool[v] for v in want):
-            return list(want.elements())
+        if all(want[v] <= pool[v] for v in range(1, 7)):
+            return sorted(kept_list)
 
         # Helpful failure message: show exactly which faces were over-requested
-        over = {v: (want[v], pool[v]) for v in want if want[v] > pool[v]}
-        parts = [f"{w}× '{v}' but only {p}× available" for v, (w, p) in sorted(over.items())]
+        parts = [f"{want[v]}× '{v}' but only {pool[v]}× available" for v in range(1, 7) if want[v] > pool[v]]
         print(f"Error: You asked to keep dice you don't have ({'; '.join(parts)}). Try again.")
 
        
@@ -212,6 +300,26 @@ def reroll(dice, kept):
     return combined # Return the updated 5-dice hand.
 
 
+def _face_mask(dice):
+    """Encode which faces are present as a 6-bit integer: bit (d - 1) is set iff face `d` occurs.
+    Repeated faces set the same bit, so duplicates vanish exactly as with set(dice)."""
+    mask = 0
+    for d in dice:
+        mask |= 1 << (d - 1)
+    return mask
+
+
+def _straight4(mask):
+    """True iff `mask` holds 4 consecutive set bits (a run of 4 faces).
+    Bit i survives the AND-chain only if bits i, i+1, i+2, i+3 are all set."""
+    return (mask & (mask >> 1) & (mask >> 2) & (mask >> 3)) != 0
+
+
+def _straight5(mask):
+    """True iff `mask` holds 5 consecutive set bits (a run of 5 faces). Same idea as `_straight4`."""
+    return (mask & (mask >> 1) & (mask >> 2) & (mask >> 3) & (mask >> 4)) != 0
+
+
 def has_straight(dice, length):
     """
     Determine if `dice` contains a straight (sequence) of a given `length`.
@@ -227,31 +335,84 @@ def has_straight(dice, length):
         True iff there is a run of consecutive integers of at least `length`.
 
     Algorithmic Notes (didactic):
-    - Convert to a *set* to remove duplicates, then sort -> strictly increasing. 
-    - Single pass counts the longest consecutive run.
+    - Encode face presence as a 6-bit mask (duplicates collapse to one bit), see `_face_mask`.
+    - AND-ing the mask with itself shifted by 1..length-1 keeps a bit only where a run of `length` starts,
+      so the answer is "is anything left?" with no set, sort, or scan loop.
     """
-    # Remove duplicates using set() (since repeated faces do not help extend a sequence) and sort ascending so consecutive values differ by exactly +1 if they belong to the same run.
-    vals = sorted(set(dice))
+    mask = _face_mask(dice)
 
-    # Early exit: if no values remain (theoretically impossible with 5 dice, but safe for generality), there cannot be a straight.
-    if not vals:
-        return False
+    # The two lengths the game uses get their unrolled AND-chains.
+    if length == 4:
+        return _straight4(mask)
+    if length == 5:
+        return _straight5(mask)
 
-    
-   
-    longest = 1  # records the best streak seen so far.
-    run = 1 # tracks the current consecutive streak length while scanning.
-    
-    # Linear scan over the strictly increasing sequence:
-    for i in range(1, len(vals)):
-        if vals[i] == vals[i - 1] + 1: # if the current value extends the prior by +1, we grow the streak;
-            run += 1
-            longest = max(longest, run) # Maintain the maximum run length encountered so far.
-        else:
-            # Gap detected
-            run = 1                    # otherwise we reset the streak to 1 starting at the current value.
-            
-    return longest >= length # A straight of requested size exists iff the longest consecutive streak meets or exceeds `length` (e.g., longest>=4 for small straight).
+    # Any other length: same AND-chain, built in a loop.
+    run = mask
+    for i in range(1, length):
+        run &= mask >> i
+    return run != 0
+
+
+def _evaluate_impl(dice):
+    """
+    Uncached scoring kernel behind `evaluate` (see there for the rules).
+
+    Parameters:
+    dice : tuple[int, ...]
+        Sorted hand, used as the canonical multiset key by `_evaluate_cached`.
+
+    Notes:
+    - Uses a fixed 7-slot tally list indexed by face (slot 0 unused) instead of a hash-based multiset:
+      for 5 dice this avoids a dict allocation, and a single `max` answers all the "n of a kind" queries.
+    - Demonstrates `for` loops, list indexing, and function calls
+    """
+
+    # Build face frequencies in a list indexed by face, e.g., [3,3,3,5,6] -> [0,0,0,3,0,1,1].
+    c = [0] * 7
+    for d in dice:
+        c[d] += 1
+
+    # Sum of all dice is reused in multiple categories (3/4-kind, chance).
+    total = sum(dice)
+
+    # Largest multiplicity (one pass); every "of a kind" check below reduces to a comparison on it.
+    mx = max(c)
+
+    # Face-presence mask for the straight checks (see `has_straight`).
+    mask = _face_mask(dice)
+
+    # Return the score vector (category => numeric score for this specific roll) as one dict literal,
+    # so the interpreter builds it in a single step instead of 13 separate item assignments.
+    return {
+        # Upper section: for each face 1..6, the score is (face value) * (frequency of that face).
+        # Keys are constant literals (the UPPER_CATEGORIES strings) indexed straight off the tally: no per-face str() call.
+        '1': c[1],
+        '2': 2 * c[2],
+        '3': 3 * c[3],
+        '4': 4 * c[4],
+        '5': 5 * c[5],
+        '6': 6 * c[6],
+        # Three / four of a kind: some face appears at least 3 / 4 times, then score is sum(all dice), else 0.
+        'three_of_a_kind': total if mx >= 3 else 0,
+        'four_of_a_kind':  total if mx >= 4 else 0,
+        # Full house (3 + 2): the largest multiplicity is 3 and another face appears exactly twice.
+        'full_house': 25 if (mx == 3 and 2 in c[1:]) else 0,
+        # Straights: small straight (length>=4) therefore 30, large straight (length>=5) therefore 40.
+        'four_straight': 30 if _straight4(mask) else 0,
+        'five_straight': 40 if _straight5(mask) else 0,
+        # Yahtzee (all five identical): some face has multiplicity exactly 5 therefore fixed 50 points.
+        'yahtzee': 50 if mx == 5 else 0,
+        # Chance: fallback category that always scores the total of the dice (no pattern required).
+        'chance': total,
+    }
+
+
+# There are only C(10,5) = 252 distinct sorted 5-dice hands, so a cache of 512 entries never evicts.
+@lru_cache(maxsize=512)
+def _evaluate_cached(key):
+    """Memoized `_evaluate_impl`, keyed on the sorted dice tuple. The cached dict is shared: never hand it out directly."""
+    return _evaluate_impl(key)
 
 
 def evaluate(dice):
@@ -273,69 +434,136 @@ def evaluate(dice):
     - chance          : sum(all dice).
 
     Notes:
-    - Uses `Counter` as an efficient multiset (hash-table) to query frequencies.
-    - Demonstrates `for` loops, generator expressions, and function calls
+    - Scores depend only on the multiset of faces, so the sorted tuple is a canonical cache key
+      and repeated hands cost one hash lookup (`_evaluate_cached`).
+    - A shallow copy of the cached dict is returned, so callers may mutate it freely.
     """
+    return dict(_evaluate_cached(tuple(sorted(dice))))
 
-    # Build a multiset of face frequencies, e.g., [3,3,3,5,6] -> {3:3, 5:1, 6:1}.
-    counts = Counter(dice)
-    
-    # Sum of all dice is reused in multiple categories (3/4-kind, chance).
-    total = sum(dice)
-    
-    # Initialize the score vector (category => numeric score for this specific roll).
-    scores: dict[str, int] = {}
 
-    # Upper section via explicit loop (could also be a dict comprehension).
-    for face in range(1, 7):
-        scores[str(face)] = face * counts[face] # For each face 1..6, the score is (face value) * (frequency of that face)
+def _score_into(dice, out):
+    """
+    Array-style scoring kernel for `evaluate_fast`: write the score of every category into `out`.
 
-    # Kinds:
-    
-    # Three of a kind:
-    # Valid iff some face appears at least 3 times, then score is sum(all dice), else 0.
-    # any(c >= 3 ...) expresses “∃ face with multiplicity ≥ 3”.
-    scores['three_of_a_kind'] = total if any(c >= 3 for c in counts.values()) else 0
+    Parameters:
+    dice : sequence of 5 ints in 1..6 (list, tuple, or `int8` array)
+    out : mutable sequence of length 13, filled in `ALL_CATEGORIES` order.
+
+    Notes:
+    - Same rules as `evaluate` (7-slot tally + 6-bit straight mask), but written with plain loops and
+      indexing only, so the identical source compiles under numba `@njit` or runs as ordinary Python.
+    """
+    c = [0, 0, 0, 0, 0, 0, 0]
+    total = 0
+    mask = 0
+    for d in dice:
+        c[d] += 1
+        total += d
+        mask |= 1 << (d - 1)
+
+    # Largest multiplicity, and whether some face appears exactly twice (for the full house).
+    mx = 0
+    has_pair = False
+    for f in range(1, 7):
+        if c[f] > mx:
+            mx = c[f]
+        if c[f] == 2:
+            has_pair = True
+
+    # Upper section: (face value) * (frequency of that face), slots 0..5.
+    for f in range(1, 7):
+        out[f - 1] = f * c[f]
+
+    # Lower section, slots 6..12.
+    out[6] = total if mx >= 3 else 0
+    out[7] = total if mx >= 4 else 0
+    out[8] = 25 if (mx == 3 and has_pair) else 0
+    out[9] = 30 if (mask & (mask >> 1) & (mask >> 2) & (mask >> 3)) != 0 else 0
+    out[10] = 40 if (mask & (mask >> 1) & (mask >> 2) & (mask >> 3) & (mask >> 4)) != 0 else 0
+    out[11] = 50 if mx == 5 else 0
+    out[12] = total
+    return out
+
+
+def _evaluate_fast_py(dice):
+    """
+    Pure-Python stand-in for `evaluate_fast` when numba/numpy are not installed.
+
+    Accepts any sequence of 5 ints (including an `int8` array) and returns a length-13 list;
+    index i holds the score of `ALL_CATEGORIES[i]`.
+    """
+    # Plain ints, so NumPy scalars never leak into the result.
+    return _score_into([int(d) for d in dice], [0] * 13)
+
+
+def _load_evaluate_fast():
+    """
+    Import numba/numpy and compile `evaluate_fast` (first access only).
 
-    # Four of a kind:
-    # Analogous logic with threshold 4.
-    scores['four_of_a_kind']  = total if any(c >= 4 for c in counts.values()) else 0
+    Returns the compiled dispatcher, or `_evaluate_fast_py` when numba/numpy are not installed.
+    """
+    try:
+        import numpy as np
+        from numba import njit, int8, int16
+    except ImportError:
+        return _evaluate_fast_py
 
-    # Full house (3 + 2):
-    # Sort the multiset cardinalities in descending order and compare to [3,2].
-    cs = sorted(counts.values(), reverse=True)
-    scores['full_house'] = 25 if cs == [3, 2] else 0 
+    # `cache=True` stores the machine code on disk so later runs skip compilation.
+    score_into = njit(cache=True)(_score_into)
 
-    # Straights:
-    # Delegate detection to `has_straight`, which checks the longest consecutive run.
-    # Small straight (length>=4) therefore 30, Large straight (length>=5) therefore 40.
-    scores['four_straight'] = 30 if has_straight(dice, 4) else 0
-    scores['five_straight'] = 40 if has_straight(dice, 5) else 0
+    # An explicit signature compiles eagerly here, so no compile latency inside the simulation loop itself.
+    @njit(int16[:](int8[:]), cache=True)
+    def evaluate_fast(dice):
+        """
+        Compiled score vector for a length-5 `int8` array of dice.
 
-    # Yahtzee (all five identical):
-    # True iff some face has multiplicity exactly 5 therefore fixed 50 points.
-    scores['yahtzee'] = 50 if any(c == 5 for c in counts.values()) else 0
+        Returns a length-13 `int16` array; index i holds the score of `ALL_CATEGORIES[i]`.
+        Call it from `@njit` simulation code: from plain Python the per-call dispatch
+        costs more than the memoized `evaluate`.
+        """
+        return score_into(dice, np.zeros(13, np.int16))
 
-    # Chance:
-    # Fallback category that always scores the total of the dice (no pattern required).
-    scores['chance'] = total
+    return evaluate_fast
 
-    return scores  # Return the complete category, score mapping for this roll.
+
+def __getattr__(name):
+    """
+    Module attribute hook (PEP 562), called only for names not defined in this module.
+
+    `evaluate_fast` is built on first access (`yahtzee.evaluate_fast` or `from yahtzee import evaluate_fast`),
+    so `import yahtzee` never loads numba; afterwards it is an ordinary module global.
+    """
+    if name == "evaluate_fast":
+        fn = _load_evaluate_fast()
+        globals()["evaluate_fast"] = fn
+        return fn
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def _upper_subtotal(card):
     """Sum over the *upper* keys, skipping `None` (unused).
-     Generator expression iterates deterministically over the required keys (UPPER_CATEGORIES = ['1','2','3','4','5','6']). 
-     For each key `k`, we include card[k] in the sum only if the entry is not None (i.e., the category has been scored). Using a comprehension.
-     This avoids treating "unused" as zero and matches the scorecard semantics."""
-    
-    return sum(card[k] for k in UPPER_CATEGORIES if card[k] is not None)
+     Iterates deterministically over the required keys (UPPER_CATEGORIES = ('1','2','3','4','5','6')).
+     Each entry is fetched once via a bound `card.get` with a sentinel default, and included in the sum only if
+     the category has been scored. This avoids treating "unused" as zero and matches the scorecard semantics."""
+    g = card.get
+    s = 0
+    for k in UPPER_CATEGORIES:
+        v = g(k, _MISSING)
+        if v is not _MISSING and v is not None:
+            s += v
+    return s
 
 
 def _lower_subtotal(card):
     """Sum over the *lower* keys, skipping `None` (unused).
     Same pattern as above, but over the lower section categories."""
-    return sum(card[k] for k in LOWER_CATEGORIES if card[k] is not None)
+    g = card.get
+    s = 0
+    for k in LOWER_CATEGORIES:
+        v = g(k, _MISSING)
+        if v is not _MISSING and v is not None:
+            s += v
+    return s
 
 
 def _bonus(upper_subtotal):
@@ -359,57 +587,53 @@ def display_scorecard(card):
     - Upper subtotal, bonus (threshold 63), lower subtotal, and total.
 
     Notes:
-    - Simple I/O with `print()` and string formatting 
+    - Lines are accumulated in a list and emitted with a single `sys.stdout.write`
+      (one write instead of ~25 `print()` calls per render); output is identical to line-by-line printing.
     """
-    print("\n=== SCORECARD ===")
+    parts = ["", "=== SCORECARD ==="]
     # Upper (1..6)
-    print("Upper Section")
-    for k in UPPER_CATEGORIES:
+    parts.append("Upper Section")
+    for k, prefix in zip(UPPER_CATEGORIES, _UPPER_FMT):
         # Iterate in canonical order to match the specification and user expectations.
-        # Format specifier `:>1` right-aligns the single-character key within width 1.
-        print(f"  {k:>1}: {_fmt(card[k])}")
+        # The row prefix is pre-formatted at import, so each row is a plain string concatenation.
+        parts.append(prefix + _fmt(card[k]))
 
     # Compute upper subtotal and bonus via dedicated helpers to keep this function focused on presentation.
     up = _upper_subtotal(card)
     b  = _bonus(up)
-    print(f"  Subtotal (1–6): {up}")
-    print(f"  Bonus (+35 if >=63): {b}")
+    parts.append(f"  Subtotal (1–6): {up}")
+    parts.append(f"  Bonus (+35 if >=63): {b}")
+
 
-    
     # Lower (combinatorics)
-    print("\nLower Section")
-    # Dictinary with readable labels for lower categories.
-    # We keep a mapping separate from internal keys to decouple display text (localizable) from logic keys.
-    labels = {
-        'three_of_a_kind': 'Three of a Kind',
-        'four_of_a_kind':  'Four of a Kind',
-        'full_house':      'Full House (25)',
-        'four_straight':   'Four Straight (30)',
-        'five_straight':   'Five Straight (40)',
-        'yahtzee':         'Yahtzee (50)',
-        'chance':          'Chance',
-    }
+    parts.append("")
+    parts.append("Lower Section")
     for k in LOWER_CATEGORIES:
         # Left-align each label within 20 characters for a neat column;  `_fmt` renders None as "-" so unused categories are visually distinct.
-        print(f"  {labels[k]:<20} : {_fmt(card[k])}")
+        parts.append(f"  {_LOWER_LABELS[k]:<20} : {_fmt(card[k])}")
 
-    
-    # Totals 
+
+    # Totals
     # Lower subtotal and grand total. Keeping these computations at the end matches the visual flow of the printed sheet and avoids duplicated work.
     low = _lower_subtotal(card)
     total = up + b + low
 
-    print("\n---") # A thin separator before the summary block to improve scannability.
-    
+    parts.append("")
+    parts.append("---") # A thin separator before the summary block to improve scannability.
+
     # Consistent label alignment improves readability in monospaced terminals.
-    print(f"Upper subtotal : {up}")
-    print(f"Bonus          : {b}")
-    print(f"Lower subtotal : {low}")
-    print(f"TOTAL          : {total}")
-    print("=================\n")
+    parts.append(f"Upper subtotal : {up}")
+    parts.append(f"Bonus          : {b}")
+    parts.append(f"Lower subtotal : {low}")
+    parts.append(f"TOTAL          : {total}")
+    parts.append("=================")
+    parts.append("")
+
+    # Single write for the whole sheet.
+    sys.stdout.write("\n".join(parts) + "\n")
 
 
-def choose(scores, used):
+def choose(scores, card):
     """
     Display the available scoring categories and obtain a valid user choice.
 
@@ -423,31 +647,37 @@ def choose(scores, used):
     scores : dict[str, int]
         The score vector for the current roll (from `evaluate(dice)`).
         Used only to display the potential score for each category.
-    used : set[str]
-        Categories already filled in the scorecard (thus unavailable).
+    card : dict[str, int|None]
+        The scorecard; categories whose entry is not `None` are already filled (thus unavailable).
 
     Returns:
     str
         The key of the chosen category (e.g., 'three_of_a_kind').
 
     Notes:
-    - `avail` is derived from `ALL_CATEGORIES` to preserve canonical order.
+    - `avail` and the menu lines are built in one pass over `ALL_CATEGORIES` (canonical order),
+      and the whole menu is emitted with a single `sys.stdout.write`.
     - Validation is two-step: format (digit) and valid range [1..len(avail)].
     """
-    # Filter categories that remain available (not in `used`), preserving order.
-    avail = [k for k in ALL_CATEGORIES if k not in used]
+    # Single pass: keep categories that remain available (still `None` on the card) and render their menu line.
+    avail = []
+    lines = ["", "Available categories for this roll:"]
+    idx = 0
+    for key in ALL_CATEGORIES:
+        if card[key] is None:
+            idx += 1
+            avail.append(key)
+            # idx: menu number, right-aligned in 2 spaces.
+            # key: category name, left-aligned in 15 spaces.
+            # scores[key]: the points this roll would score in that category.
+            lines.append(f"  {idx:>2}. {key:<15} -> {scores[key]}")
 
     # Display numbered menu (1..N) with potential scores for this roll.
-    print("\nAvailable categories for this roll:")
-    for idx, key in enumerate(avail, start=1):
-        # idx: menu number, right-aligned in 2 spaces.
-        # key: category name, left-aligned in 15 spaces.
-        # scores[key]: the points this roll would score in that category.
-        print(f"  {idx:>2}. {key:<15} -> {scores[key]}")
+    sys.stdout.write("\n".join(lines) + "\n")
 
     # Validation loop: keep asking until user provides a valid option.
     while True:
-        raw = input("Choose a number: ").strip() # Read raw input and trim whitespace.
+        raw = _prompt("Choose a number: ").strip() # Read raw input and trim whitespace.
 
         # Check 1 — must be digits only (rejects empty string, signs, letters).
         if not raw.isdigit():
@@ -471,10 +701,8 @@ def _commit(card, final_dice):
     """
     # Evaluate the final dice to get the score vector for this roll.
     scores_now = evaluate(final_dice)
-    # Let the user choose a category from those not yet used.
-    used = {k for k, v in card.items() if v is not None}
-    # Prompt until a valid choice is made.
-    choice = choose(scores_now, used)
+    # Let the user choose a category from those not yet used; prompt until a valid choice is made.
+    choice = choose(scores_now, card)
     # Commit the score to the chosen category in the scorecard.
     card[choice] = scores_now[choice]
     # Inform the user of the committed score for clarity.
@@ -516,10 +744,9 @@ def play_round(card):
 
     # Offer early stop with guarded input (Enter defaults to 'n').
     while True:
-        ans = input("Stop here? (y/N) or press Enter to continue: ").strip().lower()
-        if ans == "":
-            ans = "n"  # default per (y/N) convention
-        if ans in {"y", "n"}:
+        # Empty answer falls back to "n" (default per (y/N) convention).
+        ans = _prompt("Stop here? (y/N) or press Enter to continue: ").strip().lower() or "n"
+        if ans in _YN:
             break
         print("Please answer with 'y' (yes) or 'n' (no).")
 